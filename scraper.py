@@ -16,31 +16,109 @@ Features:
 - Single file, zero dependencies complications
 """
 
+import re
+import csv
+import codecs
 import time
 import json
+import zlib
+import pickle
+import sqlite3
 import hashlib
+import queue
 import logging
-from typing import Dict, Optional, Any, List
+import threading
+import multiprocessing
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Any, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
 from enum import Enum
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-import pandas as pd
+# selenium, webdriver_manager and bs4 are imported where they are
+# used, so Cache/RateLimit/export users don't pay for them at import time
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+try:  # optional: much faster JSON encode/decode
+    import orjson
+except ImportError:
+    orjson = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(data: Any) -> bytes:
+    """Indented JSON as UTF-8 bytes"""
+    if orjson:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:  # e.g. ints wider than 64 bits, which json handles
+            pass
+    return json.dumps(data, indent=2).encode()
+
+
+_json_loads = orjson.loads if orjson else json.loads
+
+
+@lru_cache(maxsize=1024)
+def _host(url: str) -> str:
+    """Lowercased host of a URL, without port or credentials (pages repeat links, so memoize)"""
+    return urlsplit(url).hostname or ""
+
+
+@lru_cache(maxsize=None)
+def _xpath(expr: str):
+    """Compile an XPath once (plain str results, so they don't pin the tree)"""
+    from lxml import etree
+    return etree.XPath(expr, smart_strings=False)
+
+
+@lru_cache(maxsize=512)
+def _css(selector: str):
+    """Compile a CSS selector once (soupsieve ships with bs4)"""
+    import soupsieve
+    return soupsieve.compile(selector)
+
+
+@lru_cache(maxsize=None)
+def _plain_strings() -> tuple:
+    """bs4's plain text node types, imported once (bs4 itself is loaded lazily)"""
+    from bs4 import CData, NavigableString
+    return (NavigableString, CData)
+
+
+# Extract.article candidates per field, most preferred first
+ARTICLE_FIELDS = {
+    "container": ("article", "main", ".content"),
+    "title": ("h1", "title"),
+    "author": (".author", "[rel~=author]"),
+    "date": ("time", ".date"),
+}
+_ARTICLE_SELECTOR = ", ".join(sel for prefs in ARTICLE_FIELDS.values() for sel in prefs)
+
+_WS_RE = re.compile(r'\s*\n\s*')  # blank lines + indentation around line breaks
+_TABLE_RE = re.compile(r'<table\b', re.IGNORECASE)
+_LIST_RE = re.compile(r'<[ou]l\b', re.IGNORECASE)
+_CELL_WS_RE = re.compile(r'[\r\n]+|\s{2,}')  # pd.read_html's cell whitespace folding
+_INT_RE = re.compile(r'[+-]?\d+', re.ASCII)
+_FLOAT_RE = re.compile(r'[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?', re.ASCII)
+_TABLE_NA = frozenset({  # pandas' default na_values
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+})
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+_JSON_LD_RE = re.compile(  # comments match too (group 2 None) so blocks inside them are skipped
+    r'<!--.*?-->|<script\b[^>]*?\stype\s*=\s*(["\']?)application/ld\+json\1(?=[\s/>])[^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE
+)
+
+
 # ============================================================================
 # ENUMS
 # ============================================================================
@@ -56,48 +134,105 @@ class Format(Enum):
 # ============================================================================
 
 class Cache:
-    """Ultra-minimal TTL-based caching"""
-    def __init__(self, ttl_hours: int = 24):
-        self.data = {}
+    """Ultra-minimal TTL-based LRU caching, optionally persisted to SQLite"""
+    def __init__(self, ttl_hours: int = 24, max_entries: int = 1000, path: str = None):
+        self.data = OrderedDict()
         self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.db = None
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            self.db.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, ts REAL)")
+            self.db.execute("DELETE FROM cache WHERE ts < ?", (time.time() - self.ttl_seconds,))
+            self.db.commit()
     
-    def _key(self, url: str, selector: str = "") -> str:
-        return hashlib.sha256(f"{url}:{selector}".encode()).hexdigest()
+    def key(self, url: str, selector: str = "") -> str:
+        return hashlib.blake2b(f"{url}\x00{selector}".encode(), digest_size=16).hexdigest()
     
-    def get(self, url: str, selector: str = "") -> Optional[Any]:
-        key = self._key(url, selector)
-        if key not in self.data:
-            return None
-        value, ts = self.data[key]
-        if time.time() - ts > self.ttl_seconds:
-            del self.data[key]
-            return None
-        return value
+    def get(self, url: str, selector: str = "", now: float = None) -> Optional[Any]:
+        return self.get_raw(self.key(url, selector), now)
+    
+    def set(self, url: str, value: Any, selector: str = "", now: float = None):
+        self.set_raw(self.key(url, selector), value, now)
+    
+    def get_raw(self, key: str, now: float = None) -> Optional[Any]:
+        """Look up a precomputed key()"""
+        with self._lock:
+            entry = self.data.get(key)
+            if entry is None and self.db:
+                row = self.db.execute("SELECT value, ts FROM cache WHERE key = ?", (key,)).fetchone()
+                if row:
+                    entry = (pickle.loads(zlib.decompress(row[0])), row[1])
+                    self._remember(key, entry)
+            if entry is None:
+                return None
+            value, ts = entry
+            if (now or time.time()) - ts > self.ttl_seconds:
+                del self.data[key]
+                if self.db:
+                    self.db.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    self.db.commit()
+                return None
+            self.data.move_to_end(key)
+            return value
     
-    def set(self, url: str, value: Any, selector: str = ""):
-        self.data[self._key(url, selector)] = (value, time.time())
+    def set_raw(self, key: str, value: Any, now: float = None):
+        """Store under a precomputed key()"""
+        entry = (value, now or time.time())
+        with self._lock:
+            self._remember(key, entry)
+            if self.db:
+                self.db.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", (key, zlib.compress(pickle.dumps(value), 1), entry[1]))
+                self.db.commit()
+    
+    def _remember(self, key: str, entry: tuple):
+        self.data[key] = entry
+        self.data.move_to_end(key)
+        while len(self.data) > self.max_entries:
+            self.data.popitem(last=False)
     
     def clear(self):
-        self.data.clear()
+        with self._lock:
+            self.data.clear()
+            if self.db:
+                self.db.execute("DELETE FROM cache")
+                self.db.commit()
+    
+    def close(self):
+        """Close the SQLite file (the in-memory entries stay usable)"""
+        with self._lock:
+            db, self.db = self.db, None
+        if db:
+            db.close()
 
 
 # ============================================================================
 # MINIMAL RATE LIMITER
 # ============================================================================
 
-class RateLimit:
-    """Ultra-minimal rate limiter with backoff"""
-    def __init__(self, req_per_min: int = 30):
-        self.interval = 60.0 / req_per_min
-        self.last_time = 0
+class TokenBucket:
+    """Ultra-minimal token bucket with backoff"""
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_time = time.monotonic()
         self.backoff = 1.0
+        self._lock = threading.Lock()
     
     def wait(self):
-        elapsed = time.time() - self.last_time
-        wait = (self.interval * self.backoff) - elapsed
-        if wait > 0:
-            time.sleep(wait)
-        self.last_time = time.time()
+        with self._lock:
+            now = time.monotonic()
+            rate = self.rate / self.backoff
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_time) * rate)
+            self.last_time = now
+            if self.tokens < 1:
+                delay = (1 - self.tokens) / rate
+                time.sleep(delay)
+                self.tokens, self.last_time = 1.0, now + delay
+            self.tokens -= 1
     
     def on_fail(self):
         self.backoff = min(self.backoff * 1.5, 10.0)
@@ -106,185 +241,546 @@ class RateLimit:
         self.backoff = max(self.backoff / 2.0, 1.0)
 
 
+class RateLimit:
+    """Ultra-minimal per-host rate limiter: one TokenBucket per domain, so
+    different hosts never wait on each other"""
+    def __init__(self, req_per_min: int = 30, burst: int = None):
+        self.rate = req_per_min / 60.0
+        self.capacity = float(burst or max(1, req_per_min // 10))
+        self.buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+    
+    def bucket(self, url: str = "") -> TokenBucket:
+        host = _host(url) if url else ""
+        with self._lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.rate, self.capacity)
+            return self.buckets[host]
+    
+    def wait(self, url: str = ""):
+        self.bucket(url).wait()
+    
+    def on_fail(self, url: str = ""):
+        self.bucket(url).on_fail()
+    
+    def on_success(self, url: str = ""):
+        self.bucket(url).on_success()
+
+
 # ============================================================================
 # UNIFIED EXTRACTOR
 # ============================================================================
 
+class Page(str):
+    """Fetched HTML that parses itself at most once per parser: extract_page hands one
+    Page to every extractor, so they share a (read-only) soup and lxml tree"""
+    
+    @cached_property
+    def soup(self):
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(self, 'lxml')
+    
+    @cached_property
+    def tree(self):
+        """lxml tree for bulk walks"""
+        from lxml import etree, html as lxml_html
+        parser = lxml_html.HTMLParser(huge_tree=True)  # default parser drops nodes past depth 255
+        try:
+            return lxml_html.fromstring(self, parser=parser)
+        except ValueError:  # str with an <?xml encoding=...?> declaration
+            return lxml_html.fromstring(self.encode('utf-8'), parser=parser)
+        except etree.ParserError:  # empty document
+            return lxml_html.fromstring('<html></html>', parser=parser)
+
+
 class Extract:
     """All extraction logic in one class"""
     
+    @staticmethod
+    def _soup(html: str):
+        """Soup for html (shared when html is a Page, parsed fresh for a plain str)"""
+        return (html if isinstance(html, Page) else Page(html)).soup
+    
+    @staticmethod
+    def _tree(html: str):
+        """lxml tree for html (shared when html is a Page, parsed fresh for a plain str)"""
+        return (html if isinstance(html, Page) else Page(html)).tree
+    
+    @staticmethod
+    def _text(tag) -> str:
+        """tag.get_text(strip=True), without the descendant walk for single-string tags"""
+        s = tag.string
+        # Exact types only: comments, script/style and template strings are skipped by get_text
+        return s.strip() if type(s) in _plain_strings() else tag.get_text(strip=True)
+    
     @staticmethod
     def text(html: str, max_len: int = 10000) -> str:
         """Clean text extraction"""
-        soup = BeautifulSoup(html, 'html.parser')
-        for tag in soup(['script', 'style', 'nav', 'footer']):
-            tag.decompose()
-        text = soup.get_text('\n', strip=True)
-        return '\n'.join(line.strip() for line in text.split('\n') if line.strip())[:max_len]
+        skip = {'script', 'style', 'template', 'nav', 'footer'}
+        
+        # Walk text/tail nodes instead of stripping elements: the tree is shared.
+        # Explicit stack (elements and pending tails) so deep nesting can't hit the recursion limit
+        def strings(root):
+            stack = [root]
+            while stack:
+                item = stack.pop()
+                if isinstance(item, str):
+                    yield item
+                    continue
+                if item.text:
+                    yield item.text
+                for child in reversed(item):
+                    if child.tail:
+                        stack.append(child.tail)
+                    if isinstance(child.tag, str) and child.tag not in skip:
+                        stack.append(child)
+        
+        # Collapsing only rewrites whitespace, so once a prefix cleans to more than
+        # max_len characters of content the rest of the page can't change the result
+        parts, size, limit = [], 0, 2 * max_len
+        for s in strings(Extract._tree(html)):
+            parts.append(s)
+            size += len(s) + 1
+            if size > limit:
+                text = _WS_RE.sub('\n', '\n'.join(parts)).strip()
+                if len(text) > max_len:
+                    return text[:max_len]
+                limit *= 2
+        text = _WS_RE.sub('\n', '\n'.join(parts)).strip()
+        return text[:max_len] if len(text) > max_len else text
     
     @staticmethod
     def metadata(html: str, url: str) -> Dict:
-        """Extract metadata"""
-        soup = BeautifulSoup(html, 'html.parser')
+        """Extract metadata (single pass over <title>/<meta>)"""
+        soup = Extract._soup(html)
+        meta = {}
+        for tag in soup.find_all(['title', 'meta']):
+            if tag.name == 'title':
+                meta.setdefault('title', tag.get_text())
+                continue
+            for attr in ('name', 'property'):
+                if tag.get(attr):
+                    meta.setdefault((attr, tag[attr]), tag.get('content'))
         return {
             "url": url,
             "domain": urlparse(url).netloc,
-            "title": (soup.find('title') or soup.find('meta', property='og:title')).get_text() if soup.find('title') or soup.find('meta', property='og:title') else "",
-            "description": (soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', property='og:description')).get('content', '') if (soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', property='og:description')) else "",
-            "og_image": (soup.find('meta', property='og:image') or {}).get('content'),
-            "author": (soup.find('meta', attrs={'name': 'author'}) or {}).get('content'),
-            "published": (soup.find('meta', attrs={'name': 'publish_date'}) or {}).get('content'),
+            "title": meta['title'] if 'title' in meta else meta.get(('property', 'og:title')) or "",
+            "description": meta.get(('name', 'description')) or meta.get(('property', 'og:description')) or "",
+            "og_image": meta.get(('property', 'og:image')),
+            "author": meta.get(('name', 'author')),
+            "published": meta.get(('name', 'publish_date')),
         }
     
     @staticmethod
     def tables(html: str) -> List[Dict]:
-        """Extract tables as dicts"""
-        try:
-            return [df.to_dict() for df in pd.read_html(html)]
-        except:
+        """Extract tables as {column: {row: value}} dicts, like pd.read_html(...).to_dict()"""
+        if not _TABLE_RE.search(html):
             return []
+        tables = []
+        for table in Extract._tree(html).iter('table'):
+            rows, head = Extract._table_rows(table)
+            if not rows:
+                continue
+            width = max(map(len, rows))
+            rows = [row + [None] * (width - len(row)) for row in rows]
+            
+            # Header rows (thead, else leading all-<th> rows) name the columns; none: 0..n-1
+            header, seen = [], {}
+            for j, parts in enumerate(zip(*rows[:head])):
+                name = " ".join(dict.fromkeys(p for p in parts if p)) or f"Unnamed: {j}"
+                seen[name] = seen.get(name, -1) + 1
+                header.append(f"{name}.{seen[name]}" if seen[name] else name)
+            body = rows[head:]
+            columns = [Extract._table_column([row[j] for row in body]) for j in range(width)]
+            tables.append({name: dict(enumerate(column)) for name, column in zip(header or range(width), columns)})
+        return tables
+    
+    @staticmethod
+    def _table_rows(table) -> tuple:
+        """Cell texts of a table's own rows (not nested tables'), colspan/rowspan cells
+        repeated, plus how many leading rows are header rows"""
+        def span(cell, attr):
+            value = cell.get(attr, "")
+            return min(int(value), 1000) if value.isdigit() and int(value) > 0 else 1
+        
+        rows, spans = [], {}  # spans: column -> (text, rows still covered) from rowspans above
+        in_thead, all_th = [], []
+        for tr in _xpath('./thead/tr|./tbody/tr|./tr')(table) + _xpath('./tfoot/tr')(table):
+            row, below = [], {}
+            
+            def carry():
+                while len(row) in spans:
+                    text, left = spans.pop(len(row))
+                    if left > 1:
+                        below[len(row)] = (text, left - 1)
+                    row.append(text)
+            
+            cells = _xpath('./th|./td')(tr)
+            for cell in cells:
+                carry()
+                text, rowspan = _CELL_WS_RE.sub(' ', cell.text_content()).strip(), span(cell, 'rowspan')
+                for _ in range(span(cell, 'colspan')):
+                    if rowspan > 1:
+                        below[len(row)] = (text, rowspan - 1)
+                    row.append(text)
+            carry()
+            spans = below
+            if row:
+                rows.append(row)
+                in_thead.append(tr.getparent().tag == 'thead')
+                all_th.append(bool(cells) and all(cell.tag == 'th' for cell in cells))
+        
+        flags = in_thead if any(in_thead) else all_th
+        head = next((i for i, flag in enumerate(flags) if not flag), len(flags))
+        return rows, head
+    
+    @staticmethod
+    def _table_column(values: List[Optional[str]]) -> List[Any]:
+        """Coerce one column the way pd.read_html would: NA markers -> None, then all-int
+        or all-float columns (thousands separators allowed) -> numbers"""
+        values = [None if v is None or v in _TABLE_NA else v for v in values]
+        present = [v.replace(',', '') for v in values if v is not None]
+        if not present:
+            return values
+        if all(_INT_RE.fullmatch(v) for v in present):
+            return [None if v is None else int(v.replace(',', '')) for v in values]
+        if all(_FLOAT_RE.fullmatch(v) for v in present):
+            return [None if v is None else float(v.replace(',', '')) for v in values]
+        return values
     
     @staticmethod
     def lists(html: str) -> Dict[str, List[str]]:
         """Extract lists"""
-        soup = BeautifulSoup(html, 'html.parser')
-        lists = {}
-        for i, ul in enumerate(soup.find_all('ul')):
-            items = [li.get_text(strip=True) for li in ul.find_all('li', recursive=False)]
-            if items:
-                lists[f"ul_{i}"] = items
-        for i, ol in enumerate(soup.find_all('ol')):
-            items = [li.get_text(strip=True) for li in ol.find_all('li', recursive=False)]
-            if items:
-                lists[f"ol_{i}"] = items
-        return lists
+        if not _LIST_RE.search(html):
+            return {}
+        found = {"ul": {}, "ol": {}}
+        for tag in Extract._soup(html).find_all(['ul', 'ol']):
+            lists = found[tag.name]
+            key = f"{tag.name}_{len(lists)}"
+            lists[key] = [Extract._text(li) for li in tag.children if li.name == 'li']
+        return {k: v for lists in found.values() for k, v in lists.items() if v}
     
     @staticmethod
     def json_ld(html: str) -> List[Dict]:
-        """Extract JSON-LD"""
-        soup = BeautifulSoup(html, 'html.parser')
+        """Extract JSON-LD (regex over raw HTML, no DOM build)"""
         data = []
-        for script in soup.find_all('script', type='application/ld+json'):
+        for match in _JSON_LD_RE.finditer(html):
+            if match.group(2) is None:
+                continue
             try:
-                data.append(json.loads(script.string))
-            except:
+                data.append(_json_loads(match.group(2)))
+            except ValueError:
                 pass
         return data
     
     @staticmethod
     def links(html: str, base_url: str) -> Dict[str, List[str]]:
-        """Extract links"""
-        soup = BeautifulSoup(html, 'html.parser')
-        domain = urlparse(base_url).netloc
+        """Extract http(s) links, classified by exact host match with base_url"""
+        hrefs = _xpath('//a/@href')(Extract._tree(html))
+        domain = _host(base_url)
         links = {"internal": [], "external": [], "anchors": []}
+        internal, external = links["internal"].append, links["external"].append
         
-        for link in soup.find_all('a', href=True):
-            url = link['href']
-            if url.startswith('#'):
-                links["anchors"].append(url[1:])
-            elif url.startswith(('http://', 'https://')):
-                (links["internal"] if domain in url else links["external"]).append(url)
-            else:
-                links["internal"].append(urljoin(base_url, url))
+        for href in hrefs:
+            if href.startswith('#'):
+                links["anchors"].append(href[1:])
+                continue
+            url = href if href.startswith(('http://', 'https://')) else urljoin(base_url, href)
+            if not url[:8].lower().startswith(('http://', 'https://')):
+                continue  # mailto:, tel:, javascript: ...
+            (internal if _host(url) == domain else external)(url)
         return links
     
     @staticmethod
-    def article(html: str) -> Dict[str, Any]:
-        """Extract article content"""
-        soup = BeautifulSoup(html, 'html.parser')
+    def article(html: str, max_len: int = 50000) -> Dict[str, Any]:
+        """Extract article content (body capped at max_len; counts cover the full text)"""
+        soup = Extract._soup(html)
         
-        # Find article content
-        article_elem = soup.find('article') or soup.find('main') or soup.find(class_='content')
+        # One traversal for every candidate, then pick each field by preference
+        found = _css(_ARTICLE_SELECTOR).select(soup)
+        pick = {field: next((e for sel in prefs for e in found if _css(sel).match(e)), None)
+                for field, prefs in ARTICLE_FIELDS.items()}
+        article_elem, title_elem = pick["container"], pick["title"]
+        author_elem, date_elem = pick["author"], pick["date"]
         
         # Title
-        title_elem = soup.find('h1') or soup.find('title')
-        title = title_elem.get_text(strip=True) if title_elem else ""
+        title = Extract._text(title_elem) if title_elem else ""
         
         # Body
         body = article_elem.get_text('\n', strip=True) if article_elem else soup.body.get_text('\n', strip=True) if soup.body else ""
-        
-        # Author & date
-        author_elem = soup.find(class_='author') or soup.find('[rel="author"]')
-        date_elem = soup.find('time') or soup.find(class_='date')
+        word_count = len(body.split())
         
         return {
             "title": title,
-            "body": body,
-            "author": author_elem.get_text(strip=True) if author_elem else None,
-            "date": date_elem.get_text(strip=True) if date_elem else None,
-            "word_count": len(body.split()),
-            "read_time": f"{max(1, len(body.split()) // 200)} min read"
+            "body": body[:max_len] if len(body) > max_len else body,
+            "author": Extract._text(author_elem) if author_elem else None,
+            "date": Extract._text(date_elem) if date_elem else None,
+            "word_count": word_count,
+            "read_time": f"{max(1, word_count // 200)} min read"
         }
     
     @staticmethod
     def custom(html: str, selectors: Dict[str, str]) -> Dict[str, Any]:
-        """Extract with CSS selectors"""
-        soup = BeautifulSoup(html, 'html.parser')
-        result = {}
+        """Extract with CSS selectors (one combined traversal for all of them)"""
+        from soupsieve import SelectorSyntaxError
+        compiled = {}
         for name, selector in selectors.items():
+            if not isinstance(selector, str):
+                continue  # e.g. None: reported as no match, like an invalid selector
             try:
-                elems = soup.select(selector)
-                result[name] = [e.get_text(strip=True) for e in elems] if len(elems) > 1 else (elems[0].get_text(strip=True) if elems else None)
-            except:
-                result[name] = None
+                compiled[name] = _css(selector)
+            except SelectorSyntaxError:
+                pass
+        
+        # Walk once with the union, then attribute each hit to its selectors
+        matches = {name: [] for name in compiled}
+        if compiled:
+            union = _css(", ".join(selectors[name] for name in compiled))
+            for elem in union.select(Extract._soup(html)):
+                for name, sel in compiled.items():
+                    if sel.match(elem):
+                        matches[name].append(elem)
+        
+        result = {}
+        for name in selectors:
+            elems = matches.get(name)
+            result[name] = [Extract._text(e) for e in elems] if elems and len(elems) > 1 else (Extract._text(elems[0]) if elems else None)
         return result
 
 
+# Sections of result["data"], computed only when requested
+SECTIONS = {
+    "metadata": lambda html, url: Extract.metadata(html, url),
+    "article": lambda html, url: Extract.article(html),
+    "text": lambda html, url: Extract.text(html),
+    "tables": lambda html, url: Extract.tables(html),
+    "lists": lambda html, url: Extract.lists(html),
+    "json_ld": lambda html, url: Extract.json_ld(html),
+    "links": lambda html, url: Extract.links(html, url),
+}
+
+
+def extract_page(html: str, url: str, sections: tuple = tuple(SECTIONS), selectors: Dict[str, str] = None) -> Dict[str, Any]:
+    """Run the extractors on fetched HTML (module-level so it can run in a worker process)"""
+    html = Page(html)
+    parsed = {"data": {name: SECTIONS[name](html, url) for name in sections}}
+    if selectors:
+        parsed["custom"] = Extract.custom(html, selectors)
+    return parsed
+
+
 # ============================================================================
 # MAIN SCRAPER
 # ============================================================================
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
+
+# Resources that never reach the extractors: media, fonts, trackers
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.woff", "*.woff2", "*.ttf",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*", "*facebook.net*",
+]
+
+# Static fetches hold no browser, so they can overlap far more than `workers`
+HTTP_THREADS = 16
+
+_DRIVER_PATH: Optional[str] = None
+_DRIVER_LOCK = threading.Lock()
+
+
+def _driver_path() -> str:
+    """Resolve the chromedriver binary once per process"""
+    global _DRIVER_PATH
+    with _DRIVER_LOCK:
+        if _DRIVER_PATH is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            _DRIVER_PATH = ChromeDriverManager().install()
+    return _DRIVER_PATH
+
+
 class Scraper:
     """Universal web scraper - max capability, minimal code"""
     
-    def __init__(self, cache_ttl: int = 24, req_per_min: int = 30, headless: bool = True):
-        self.cache = Cache(ttl_hours=cache_ttl) if cache_ttl else None
+    def __init__(self, cache_ttl: int = 24, req_per_min: int = 30, headless: bool = True, workers: int = 1,
+                 cache_path: str = None, parse_processes: int = 0):
+        self.cache = Cache(ttl_hours=cache_ttl, path=cache_path) if cache_ttl else None
         self.limiter = RateLimit(req_per_min=req_per_min)
         self.headless = headless
-        self.driver = None
-    
-    def _get_driver(self) -> webdriver.Chrome:
-        """Lazy-load browser"""
-        if not self.driver:
-            opts = Options()
-            opts.add_argument("--no-sandbox")
-            opts.add_argument("--disable-dev-shm-usage")
-            opts.add_argument("--disable-gpu")
-            opts.add_argument("--window-size=1920,1080")
-            if self.headless:
-                opts.add_argument("--headless=new")
-            opts.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36")
-            
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=opts)
-        return self.driver
+        self.workers = max(1, workers)
+        self.drivers = []
+        self._spawned = 0
+        self._idle = []
+        self._lock = threading.Lock()
+        self._pool = threading.Condition(self._lock)
+        self.parse_processes = parse_processes
+        self._parse_pool = None
+        # Backpressure: fetch threads wait here rather than queue every page's HTML in the pool
+        self._parse_slots = threading.BoundedSemaphore(2 * parse_processes) if parse_processes else None
+        self.session = None
+        self._writes = queue.Queue()
+        self._writer = None
+    
+    def _parser(self) -> ProcessPoolExecutor:
+        """Lazy-start the HTML parsing processes"""
+        with self._lock:
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=self.parse_processes,
+                    mp_context=multiprocessing.get_context("spawn")  # fork + live browser threads is unsafe
+                )
+            return self._parse_pool
     
-    def fetch(self, url: str, wait_for: str = None, scroll: bool = False) -> Optional[str]:
-        """Fetch HTML with browser automation"""
-        self.limiter.wait()
+    def _new_driver(self) -> "webdriver.Chrome":
+        """Start a browser"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        
+        opts = Options()
+        opts.add_argument("--no-sandbox")
+        opts.add_argument("--disable-dev-shm-usage")
+        opts.add_argument("--disable-gpu")
+        opts.add_argument("--window-size=1920,1080")
+        if self.headless:
+            opts.add_argument("--headless=new")
+        opts.add_argument(f"user-agent={USER_AGENT}")
+        # Only the serialized DOM is read: skip images, return at DOMContentLoaded
+        opts.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        opts.page_load_strategy = "eager"
+        opts.add_argument("--blink-settings=imagesEnabled=false")
+        opts.add_argument("--disable-extensions")
+        opts.add_argument("--disable-background-networking")
+        
+        service = Service(_driver_path())
+        driver = webdriver.Chrome(service=service, options=opts)
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        return driver
+    
+    @contextmanager
+    def _browser(self):
+        """Check a browser out of the pool, starting one if below `workers`"""
+        with self._pool:
+            # Waiters re-check after every return and failed start, so a slot freed by
+            # a browser that failed to launch is picked up instead of waited on forever
+            while not self._idle and self._spawned >= self.workers:
+                self._pool.wait()
+            driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                self._spawned += 1
+        if driver is None:
+            try:
+                driver = self._new_driver()
+            except Exception:
+                with self._pool:
+                    self._spawned -= 1
+                    self._pool.notify()
+                raise
+            with self._lock:
+                self.drivers.append(driver)
         try:
-            driver = self._get_driver()
-            driver.get(url)
-            
-            # Wait for element
-            if wait_for:
-                WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_for)))
-            
-            # Scroll to load lazy content
-            if scroll:
-                for _ in range(5):
-                    driver.execute_script("window.scrollBy(0, window.innerHeight);")
-                    time.sleep(0.5)
-            
-            html = driver.page_source
-            self.limiter.on_success()
+            yield driver
+        finally:
+            with self._pool:
+                self._idle.append(driver)
+                self._pool.notify()
+    
+    def fetch(self, url: str, wait_for: str = None, scroll: bool = False, render: bool = True) -> Optional[str]:
+        """Fetch HTML with browser automation (render=False: plain HTTP unless wait_for/scroll)"""
+        self.limiter.wait(url)
+        try:
+            if render or wait_for or scroll:
+                with self._browser() as driver:
+                    html = self._load(driver, url, wait_for, scroll)
+            else:
+                html = self._get(url)
+            self.limiter.on_success(url)
             logger.info(f"✓ Fetched {url}")
             return html
         except Exception as e:
-            self.limiter.on_fail()
+            self.limiter.on_fail(url)
             logger.error(f"✗ Failed to fetch {url}: {e}")
             return None
     
+    def fetch_many(self, urls: List[str], wait_for: str = None, scroll: bool = False,
+                   render: bool = True) -> List[Optional[str]]:
+        """Fetch several URLs across up to `workers` browsers, in input order"""
+        with ThreadPoolExecutor(max_workers=self._threads(render, wait_for, scroll)) as pool:
+            return list(pool.map(lambda url: self.fetch(url, wait_for=wait_for, scroll=scroll, render=render), urls))
+    
+    def _threads(self, render: bool = True, wait_for: str = None, scroll: bool = False) -> int:
+        """Thread count for a batch: one per browser, or HTTP_THREADS for plain HTTP"""
+        if render or wait_for or scroll:
+            return self.workers
+        return max(self.workers, HTTP_THREADS)
+    
+    def _get(self, url: str) -> str:
+        """Fetch static HTML without a browser"""
+        resp = self._session().get(url, timeout=20)
+        resp.raise_for_status()
+        if 'charset' not in resp.headers.get('Content-Type', '').lower():
+            # requests falls back to ISO-8859-1 for text/*: trust the page's <meta charset> instead
+            match = _META_CHARSET_RE.search(resp.content[:4096])
+            charset = match and match.group(1).decode('ascii')
+            try:
+                resp.encoding = codecs.lookup(charset).name if charset else resp.apparent_encoding
+            except LookupError:
+                resp.encoding = resp.apparent_encoding
+        return resp.text
+    
+    def _session(self):
+        """Lazy-create one pooled HTTP session (keep-alive + retries) for all static fetches"""
+        with self._lock:
+            if self.session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                                      max_retries=Retry(total=3, backoff_factor=0.3))
+                self.session = requests.Session()
+                self.session.headers["User-Agent"] = USER_AGENT
+                self.session.mount("http://", adapter)
+                self.session.mount("https://", adapter)
+            return self.session
+    
+    @staticmethod
+    def _load(driver: "webdriver.Chrome", url: str, wait_for: str = None, scroll: bool = False) -> str:
+        """Navigate one browser and return its HTML"""
+        driver.get(url)
+        
+        # Wait for element
+        if wait_for:
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_for)))
+        
+        # Scroll to load lazy content
+        if scroll:
+            for _ in range(5):
+                driver.execute_script("window.scrollBy(0, window.innerHeight);")
+                Scraper._wait_for_scroll_settle(driver)
+        
+        return driver.execute_script("return document.documentElement.outerHTML;")
+    
+    @staticmethod
+    def _wait_for_scroll_settle(driver: "webdriver.Chrome", timeout: float = 3.0, poll: float = 0.1):
+        """Wait until the page height stops changing (lazy content loaded) or timeout"""
+        deadline = time.monotonic() + timeout
+        last, stable = None, 0
+        while time.monotonic() < deadline:
+            height = driver.execute_script("return document.body.scrollHeight")
+            stable = stable + 1 if height == last else 0
+            if stable >= 2:
+                return
+            last = height
+            time.sleep(poll)
+    
     def scrape(
         self,
         url: str,
@@ -292,21 +788,38 @@ class Scraper:
         wait_for: str = None,
         scroll: bool = False,
         extract_all: bool = True,
-        use_cache: bool = True
+        use_cache: bool = True,
+        sections: List[str] = None,
+        render: bool = True
     ) -> Dict[str, Any]:
-        """Scrape and extract data"""
+        """Scrape and extract data (`sections` limits extract_all to those SECTIONS)"""
+        return self._scrape(url, selectors, wait_for, scroll, extract_all, use_cache, sections, render)()
+    
+    def _scrape(self, url: str, selectors: Dict[str, str] = None, wait_for: str = None, scroll: bool = False,
+                extract_all: bool = True, use_cache: bool = True, sections: List[str] = None,
+                render: bool = True) -> Callable[[], Dict[str, Any]]:
+        """Check the cache, fetch and start extracting; call the returned function for the result.
+        With parse_processes the page is parsed in the background meanwhile, so batch threads can
+        move on to their next fetch"""
+        sections = tuple(sections or SECTIONS) if extract_all else ()
+        unknown = set(sections) - SECTIONS.keys()
+        if unknown:
+            raise ValueError(f"Unknown sections: {sorted(unknown)}")
         
         # Check cache
-        if use_cache and self.cache:
-            cached = self.cache.get(url, str(selectors or ""))
+        now = time.time()
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            key = self.cache.key(url, repr((sorted(selectors.items()) if selectors else None, sections)))
+            cached = self.cache.get_raw(key, now)
             if cached:
                 logger.info(f"⚡ Cache hit: {url}")
-                return cached
+                return lambda: cached
         
         # Fetch HTML
-        html = self.fetch(url, wait_for=wait_for, scroll=scroll)
+        html = self.fetch(url, wait_for=wait_for, scroll=scroll, render=render)
         if not html:
-            return {"status": "error", "url": url, "message": "Failed to fetch"}
+            return lambda: {"status": "error", "url": url, "message": "Failed to fetch"}
         
         # Extract
         result = {
@@ -315,54 +828,102 @@ class Scraper:
             "scraped_at": datetime.now().isoformat(),
         }
         
-        if extract_all:
-            result["data"] = {
-                "metadata": Extract.metadata(html, url),
-                "article": Extract.article(html),
-                "text": Extract.text(html),
-                "tables": Extract.tables(html),
-                "lists": Extract.lists(html),
-                "json_ld": Extract.json_ld(html),
-                "links": Extract.links(html, url),
-            }
+        # Parse in a worker process when configured, so this thread can go fetch again
+        if self.parse_processes:
+            self._parse_slots.acquire()
+            try:
+                parsed = self._parser().submit(extract_page, html, url, sections, selectors)
+            except BaseException:
+                self._parse_slots.release()
+                raise
+            parsed.add_done_callback(lambda _: self._parse_slots.release())
         else:
-            result["data"] = {}
+            result.update(extract_page(html, url, sections, selectors))
         
-        if selectors:
-            result["custom"] = Extract.custom(html, selectors)
+        def finish() -> Dict[str, Any]:
+            if self.parse_processes:
+                result.update(parsed.result())
+            if use_cache:
+                self.cache.set_raw(key, result, now)
+            return result
+        return finish
+    
+    def scrape_multiple(self, urls: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """Scrape multiple URLs concurrently, in input order (each distinct URL once)"""
+        unique = list(dict.fromkeys(urls))
         
-        # Cache result
-        if use_cache and self.cache:
-            self.cache.set(url, result, str(selectors or ""))
+        def run(item):
+            i, url = item
+            logger.info(f"[{i}/{len(unique)}] {url}")
+            return url, self._scrape(url, **kwargs)
         
-        return result
+        # Fetch threads only start each page's extraction; results are collected here in order
+        threads = self._threads(kwargs.get('render', True), kwargs.get('wait_for'), kwargs.get('scroll', False))
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = {url: finish() for url, finish in pool.map(run, enumerate(unique, 1))}
+        return [results[url] for url in urls]
     
-    def scrape_multiple(self, urls: List[str], **kwargs) -> List[Dict[str, Any]]:
-        """Scrape multiple URLs"""
-        results = []
-        for i, url in enumerate(urls, 1):
-            logger.info(f"[{i}/{len(urls)}] {url}")
-            results.append(self.scrape(url, **kwargs))
-        return results
-    
-    def export(self, data: Any, filepath: str, fmt: Format = Format.JSON):
-        """Export data to file"""
+    def export(self, data: Any, filepath: str, fmt: Format = Format.JSON, background: bool = False):
+        """Export data to file (background=True: queue the write and return; don't mutate data after)"""
+        if background:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._drain_writes, daemon=True)
+                    self._writer.start()
+            self._writes.put((data, filepath, fmt))
+            return
+        self._write(data, filepath, fmt)
+    
+    def _drain_writes(self):
+        """Writer thread: perform queued exports in order until the None sentinel"""
+        while True:
+            item = self._writes.get()
+            if item is None:
+                return
+            try:
+                self._write(*item)
+            except Exception as e:
+                logger.error(f"✗ Failed to export {item[1]}: {e}")
+    
+    def _write(self, data: Any, filepath: str, fmt: Format):
+        """Write one export to disk"""
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         
         if fmt == Format.JSON:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(_json_dumps(data))
         elif fmt == Format.CSV:
             if isinstance(data, list) and data and isinstance(data[0], dict):
-                pd.DataFrame(data).to_csv(filepath, index=False)
+                fields = list(dict.fromkeys(k for row in data for k in row))
+                with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=fields)
+                    writer.writeheader()
+                    writer.writerows(data)
         
         logger.info(f"✓ Exported to {filepath}")
     
     def close(self):
-        """Close browser"""
-        if self.driver:
-            self.driver.quit()
+        """Finish queued exports, then close all browsers, the HTTP session and parsing processes"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer:
+            self._writes.put(None)
+            writer.join()
+        with self._lock:
+            drivers, self.drivers, self._spawned = self.drivers, [], 0
+            self._idle = []
+            parse_pool, self._parse_pool = self._parse_pool, None
+            session, self.session = self.session, None
+        for driver in drivers:
+            driver.quit()
+        if drivers:
             logger.info("Browser closed")
+        if session:
+            session.close()
+        if parse_pool:
+            parse_pool.shutdown()
+        if self.cache:
+            self.cache.close()
     
     def __enter__(self):
         return self
@@ -381,7 +942,7 @@ def scrape(url: str, **kwargs) -> Dict[str, Any]:
         return s.scrape(url, **kwargs)
 
 
-def scrape_batch(urls: List[str], **kwargs) -> List[Dict[str, Any]]:
+def scrape_batch(urls: List[str], workers: int = 1, **kwargs) -> List[Dict[str, Any]]:
     """Batch scraping one-liner"""
-    with Scraper() as s:
+    with Scraper(workers=workers) as s:
         return s.scrape_multiple(urls, **kwargs)